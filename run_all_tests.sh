@@ -175,7 +175,7 @@ report_section "RTL Simulation - Main Tests"
 
 if python3 -c "import cocotb" 2>/dev/null; then
     cd "$TEST_DIR"
-    if make -B > "$RESULTS_DIR/phase3_rtl_main.log" 2>&1; then
+    if make -B DUMP_WAVES=1 > "$RESULTS_DIR/phase3_rtl_main.log" 2>&1; then
         log_success "RTL main tests PASSED (24 tests with Verilog simulation)"
         echo "✓ RTL simulation (24 main tests) completed successfully" >> "$RESULTS_DIR/EXECUTION_REPORT.md"
 
@@ -14,12 +14,15 @@ module tb ();
 
   // -----------------------------------------------------------
   // TELEMETRY RECORDING — FST for high-speed waveform analysis
+  // Off by default; `make DUMP_WAVES=1` defines DUMP_WAVES.
   // -----------------------------------------------------------
+`ifdef DUMP_WAVES
   initial begin
     $dumpfile("tb.fst");
     $dumpvars(0, tb);
     #1;
   end
+`endif
 
   // -----------------------------------------------------------
   // SYSTEM WIRES
@@ -33,6 +36,192 @@ module tb ();
   wire [7:0] uio_out;
   wire [7:0] uio_oe;
 
+  localparam [7:0] VAELIX_KEY   = 8'hB6;
+  localparam [7:0] SEG_VERIFIED = 8'hC1;
+  localparam [7:0] SEG_LOCKED   = 8'hC7;
+  localparam [7:0] SEG_BRICK    = 8'h00;
+
+  // -----------------------------------------------------------
+  // CLOCK GENERATOR — while clk_gen is set the harness toggles
+  // clk itself at 25 MHz (40 ns), so no Python clock coroutine
+  // wakes on every edge. Suites that drive clk from Python (the
+  // frequency sweep) leave clk_gen at 0. An X clock starts high.
+  // -----------------------------------------------------------
+  localparam CLK_HALF_NS = 20;
+  reg        clk_gen = 1'b0;
+
+  always begin
+    #(CLK_HALF_NS);
+    if (clk_gen) clk = (clk !== 1'b1);
+  end
+
+  // -----------------------------------------------------------
+  // RESET SEQUENCER — a test drives rst_n low and loads
+  // reset_hold with N; rst_n is released on the N-th rising edge
+  // after that, as a Python ClockCycles(clk, N) wait would, but
+  // without waking Python on every edge. Idle while reset_hold is 0.
+  //
+  // Every suite holds reset for RESET_HOLD_CYCLES = 2 clocks. The
+  // replay FSM, drive-fight counter and key register all clear
+  // asynchronously on rst_n falling. The only state that needs a
+  // clock edge is the tamper tracker (uio_in_prev), which reloads
+  // on the first edge with rst_n low. The second edge is margin.
+  // -----------------------------------------------------------
+  reg  [7:0] reset_hold = 8'd0;
+
+  always @(posedge clk) begin
+    if (reset_hold != 8'd0) begin
+      reset_hold <= reset_hold - 8'd1;
+      if (reset_hold == 8'd1) rst_n <= 1'b1;
+    end
+  end
+
+  // -----------------------------------------------------------
+  // KEY SWEEP GENERATOR — steps ui_in once per clock while
+  // sweep_en is set, from its current value up to 8'hFF, then
+  // raises sweep_done; clearing sweep_en re-arms it. Idle (and
+  // transparent to cocotb writes on ui_in) unless a test sets
+  // sweep_en.
+  // -----------------------------------------------------------
+  reg        sweep_en   = 1'b0;
+  reg        sweep_done = 1'b0;
+
+  always @(posedge clk) begin
+    if (!sweep_en)
+      sweep_done <= 1'b0;
+    else if (!sweep_done) begin
+      if (ui_in == 8'hFF) sweep_done <= 1'b1;
+      else                ui_in      <= ui_in + 8'd1;
+    end
+  end
+
+  // -----------------------------------------------------------
+  // GLITCH TRIPWIRE — during the key sweep, any uo_out change that
+  // lands on VERIFIED while ui_in is not the key (including a
+  // zero-width gate-level spike) is printed with its picosecond
+  // timestamp and latches glitch_breach for the rest of the run.
+  // The check runs in the same event as the uo_out change, on
+  // purpose: deferring it to the end of the time step (cocotb's
+  // ReadOnly) would let a delta-cycle spike settle away unseen.
+  // ui_in only moves on the sweep's clock edge, so it is stable
+  // whenever a combinational uo_out change is evaluated.
+  // -----------------------------------------------------------
+  reg        glitch_breach = 1'b0;
+
+  initial $timeformat(-12, 0, " ps", 0);
+
+  always @(uo_out) begin
+    if (sweep_en && uo_out == SEG_VERIFIED && ui_in != VAELIX_KEY) begin
+      glitch_breach = 1'b1;
+      $display("GLITCH BREACH at %t: uo_out=0x%h (VERIFIED) when ui_in=0x%h (NOT 0x%h)",
+               $realtime, uo_out, ui_in, VAELIX_KEY);
+    end
+  end
+
+  // -----------------------------------------------------------
+  // TAMPER PIN SEQUENCER — while tamper_sweep_en is set, runs the
+  // per-pin tamper check for uio_in[1..7] in turn, counting edges
+  // in tamper_cyc: power cycle (ena low 3 clocks), soft reset
+  // (rst_n low 5 clocks), release, then at cycle 10 record LOCKED
+  // in tamper_locked[bit] and drive uio_in = 1 << bit, and at
+  // cycle 12 record BRICK in tamper_bricked[bit]. tamper_sweep_done
+  // rises one clock after the last record, so both scoreboards are
+  // settled when it does. Clearing tamper_sweep_en re-arms it.
+  // -----------------------------------------------------------
+  reg        tamper_sweep_en   = 1'b0;
+  reg        tamper_sweep_done = 1'b0;
+  reg  [2:0] tamper_bit        = 3'd1;
+  reg  [3:0] tamper_cyc        = 4'd0;
+  reg  [7:0] tamper_locked     = 8'h00;
+  reg  [7:0] tamper_bricked    = 8'h00;
+
+  always @(posedge clk) begin
+    if (!tamper_sweep_en) begin
+      tamper_sweep_done <= 1'b0;
+      tamper_bit        <= 3'd1;
+      tamper_cyc        <= 4'd0;
+      tamper_locked     <= 8'h00;
+      tamper_bricked    <= 8'h00;
+    end else if (!tamper_sweep_done) begin
+      tamper_cyc <= tamper_cyc + 4'd1;
+      case (tamper_cyc)
+        4'd0:  ena <= 1'b0;
+        4'd3:  begin
+                 ena    <= 1'b1;
+                 ui_in  <= 8'h00;
+                 uio_in <= 8'h00;
+                 rst_n  <= 1'b0;
+               end
+        4'd8:  rst_n <= 1'b1;
+        4'd10: begin
+                 tamper_locked[tamper_bit] <= (uo_out == SEG_LOCKED);
+                 uio_in <= 8'h01 << tamper_bit;
+               end
+        4'd12: begin
+                 tamper_bricked[tamper_bit] <= (uo_out == SEG_BRICK);
+                 if (tamper_bit != 3'd7) begin
+                   tamper_bit <= tamper_bit + 3'd1;
+                   tamper_cyc <= 4'd0;
+                 end
+               end
+        4'd13: tamper_sweep_done <= 1'b1;
+        default: ;
+      endcase
+    end
+  end
+
+  // -----------------------------------------------------------
+  // BRICK MONITOR — checks the tamper latch on every clock rather
+  // than only where a test samples it: while uo_out shows BRICK the
+  // glow array must be dark, and once BRICK is seen with ena high,
+  // nothing short of dropping ena (no key, no soft reset) may take
+  // uo_out out of it. A violation is printed with its timestamp and
+  // latches brick_leak for the rest of the run.
+  // -----------------------------------------------------------
+  reg        brick_leak = 1'b0;
+  reg        was_brick  = 1'b0;
+
+  always @(posedge clk) begin
+    if (uo_out == SEG_BRICK && uio_out != 8'h00) begin
+      brick_leak <= 1'b1;
+      $display("BRICK LEAK at %t: uio_out=0x%h lit while uo_out is BRICK",
+               $realtime, uio_out);
+    end
+    if (was_brick && ena && uo_out != SEG_BRICK) begin
+      brick_leak <= 1'b1;
+      $display("BRICK LEAK at %t: uo_out=0x%h left BRICK without a power cycle",
+               $realtime, uo_out);
+    end
+    was_brick <= ena && (uo_out == SEG_BRICK);
+  end
+
+`ifndef GL_TEST
+  // -----------------------------------------------------------
+  // AUTHORIZATION SWEEP CHECK — sticky flag, set if is_authorized
+  // disagrees with (ui_in == key) at any step of the key sweep; the
+  // first offending input is latched in sweep_auth_key and printed
+  // with its timestamp. Both clear with sweep_en. RTL only: the
+  // gate-level netlist does not keep is_authorized.
+  // -----------------------------------------------------------
+  reg        sweep_auth_err = 1'b0;
+  reg  [7:0] sweep_auth_key = 8'h00;
+
+  always @(posedge clk) begin
+    if (!sweep_en) begin
+      sweep_auth_err <= 1'b0;
+      sweep_auth_key <= 8'h00;
+    end else if (!sweep_done &&
+                 (user_project.is_authorized ^ (ui_in == VAELIX_KEY))) begin
+      if (!sweep_auth_err) begin
+        sweep_auth_key <= ui_in;
+        $display("AUTH MISMATCH at %t: is_authorized=%b for ui_in=0x%h (key 0x%h)",
+                 $realtime, user_project.is_authorized, ui_in, VAELIX_KEY);
+      end
+      sweep_auth_err <= 1'b1;
+    end
+  end
+`endif
+
   // -----------------------------------------------------------
   // DUT: SENTINEL MARK I
   // Module name must match the top_module in info.yaml exactly.
@@ -23,6 +23,7 @@
 
 import cocotb
 from cocotb.clock import Clock
+from cocotb.handle import Immediate
 from cocotb.triggers import RisingEdge, FallingEdge, Timer, ClockCycles
 
 # ============================================================================
@@ -35,27 +36,116 @@ GLOW_ACTIVE     = 0xFF   # All status LEDs ignited
 GLOW_DORMANT    = 0x00   # All status LEDs dark
 UIO_ALL_OUTPUT  = 0xFF   # All bidirectional pins driven as output
 CLOCK_PERIOD_NS = 40     # 25 MHz = 40ns period
+SETTLE_NS       = 2      # Settle time before sampling outputs after a write
+
+# Expected-value text for failure messages
+SEG_LOCKED_HEX   = hex(SEG_LOCKED)
+SEG_VERIFIED_HEX = hex(SEG_VERIFIED)
+GLOW_ACTIVE_HEX  = hex(GLOW_ACTIVE)
+
+# Key as the bit-by-bit sweep builds it, LSB first: PARTIAL_KEYS[b] holds
+# key bits 0..b, and only the complete key may authorize.
+PARTIAL_KEYS     = tuple(VAELIX_KEY & ((2 << bit) - 1) for bit in range(8))
+PARTIAL_EXPECTED = tuple(SEG_VERIFIED if pk == VAELIX_KEY else SEG_LOCKED
+                         for pk in PARTIAL_KEYS)
+# Alternating valid/invalid key and the lock state each one should give,
+# indexed by toggle parity (i & 1)
+TOGGLE_KEYS     = (VAELIX_KEY, 0x00)
+TOGGLE_EXPECTED = (SEG_VERIFIED, SEG_LOCKED)
+# Key split into its even- and odd-position bits (edge case 5)
+KEY_EVEN_BITS   = VAELIX_KEY & 0xAA   # 0b10101010
+KEY_ODD_BITS    = VAELIX_KEY & 0x55   # 0b01010101
 
 # ============================================================================
 # HELPER FUNCTIONS
 # ============================================================================
 
+async def wait_cycles(clk, n):
+    """
+    Advance n cycles of the 25 MHz clock from an edge (or from within the
+    first half-cycle after one), ending just after the n-th rising edge as
+    ClockCycles(clk, n) does. One Timer to mid-cycle before the last edge
+    replaces n per-edge callbacks; a bare Timer(n * period) would expire
+    in the same time step as that edge and race it.
+    """
+    if n > 1:
+        await Timer((n - 1) * CLOCK_PERIOD_NS + CLOCK_PERIOD_NS // 2, unit="ns")
+    await RisingEdge(clk)
+
+
 async def reset_sentinel(dut):
-    """Standard Power-On Reset sequence for the Sentinel Core."""
-    dut.ena.value    = 1
-    dut.ui_in.value  = 0
-    dut.uio_in.value = 0
-    dut.rst_n.value  = 0
-    await ClockCycles(dut.clk, 10)
+    """
+    Standard Power-On Reset sequence for the Sentinel Core.
+    The initial values are written immediately (cocotb 2.0's replacement
+    for setimmediatevalue) so they are in place before the freshly
+    started clock's first edge, with no scheduled-write pass.
+    """
+    dut.ena.value    = Immediate(1)
+    dut.ui_in.value  = Immediate(0)
+    dut.uio_in.value = Immediate(0)
+    dut.rst_n.value  = Immediate(0)
+    await wait_cycles(dut.clk, 10)
     dut.rst_n.value  = 1
     await ClockCycles(dut.clk, 1)
 
 
+async def locked_baseline(dut, align=False):
+    """
+    Drive ui_in to 0x00 and let it settle, so every injection starts from
+    LOCKED. key_match is a plain assign on ui_in, so the outputs follow
+    within SETTLE_NS without a clock edge, as sample_and_clear already
+    relies on. Sweeps that inject relative to a rising edge pass
+    align=True to then wait for the next one.
+    """
+    dut.ui_in.value = 0x00
+    await Timer(SETTLE_NS, unit="ns")
+    if align:
+        await RisingEdge(dut.clk)
+
+
+async def setup_clock(dut):
+    """
+    Start the 25 MHz system clock and bring the Sentinel out of reset.
+    Every fixed-frequency test comes up through here, so the clock source
+    can be swapped in one place.
+    """
+    cocotb.start_soon(Clock(dut.clk, CLOCK_PERIOD_NS, unit="ns").start())
+    await reset_sentinel(dut)
+
+
+def read_outputs(dut):
+    """
+    Sample the segment bus and the glow LEDs together, as plain ints.
+    """
+    return int(dut.uo_out.value), int(dut.uio_out.value)
+
+
+async def sample_and_clear(dut, attack, where, clear_key=0x00):
+    """
+    Settle, check that the injected key authorized (VERIFIED segments and
+    ACTIVE glow), then drive `clear_key` and check that the Sentinel falls
+    back to LOCKED. This is the check-then-clear tail shared by the
+    post-edge, falling-edge and clock-phase sweeps; `attack` and `where`
+    label the failure messages.
+    """
+    await Timer(SETTLE_NS, unit="ns")
+    seg_out, glow_out = read_outputs(dut)
+    assert seg_out == SEG_VERIFIED, \
+        f"{attack} FAILURE at {where}: Expected VERIFIED ({SEG_VERIFIED_HEX}), got {hex(seg_out)}"
+    assert glow_out == GLOW_ACTIVE, \
+        f"{attack} GLOW FAILURE at {where}: Expected ACTIVE ({GLOW_ACTIVE_HEX}), got {hex(glow_out)}"
+
+    dut.ui_in.value = clear_key
+    await Timer(SETTLE_NS, unit="ns")
+    seg_out = int(dut.uo_out.value)
+    assert seg_out == SEG_LOCKED, \
+        f"{attack} RE-LOCK FAILURE at {where}: Expected LOCKED ({SEG_LOCKED_HEX}), got {hex(seg_out)}"
+
+
 # ============================================================================
 # TEST 1: TIMING-ATTACK SIMULATION — PRE-EDGE KEY INJECTION
 # ============================================================================
-@cocotb.test()
-async def test_timing_attack_pre_edge(dut):
+async def sweep_pre_edge(dut, offsets):
     """
     TIMING ATTACK TEST 1: Pre-Edge Key Injection
     
@@ -72,41 +162,30 @@ async def test_timing_attack_pre_edge(dut):
     dut._log.info("PROSECUTOR TEST 1: PRE-EDGE KEY INJECTION TIMING ATTACK")
     dut._log.info("="*72)
     
-    clock = Clock(dut.clk, CLOCK_PERIOD_NS, unit="ns")
-    cocotb.start_soon(clock.start())
-    await reset_sentinel(dut)
-    
-    # Test various pre-edge injection timings
-    # T = clock period (40ns), test at T-30ns, T-20ns, T-10ns, T-5ns before edge
-    pre_edge_offsets = [30, 20, 10, 5, 2, 1]
-    
-    for offset_ns in pre_edge_offsets:
+    for offset_ns in offsets:
         dut._log.info(f"\n--- Testing key injection {offset_ns}ns before rising edge ---")
         
-        # Start with locked state
-        dut.ui_in.value = 0x00
-        await ClockCycles(dut.clk, 2)
+        # Start with locked state, aligned to a rising edge
+        await locked_baseline(dut, align=True)
         
-        # Wait until just before the rising edge
-        await RisingEdge(dut.clk)
+        # Wait until just before the next rising edge
         await Timer(CLOCK_PERIOD_NS - offset_ns, unit="ns")
         
         # Inject key BEFORE the next rising edge
         dut.ui_in.value = VAELIX_KEY
-        dut._log.info(f"  Key injected at T-{offset_ns}ns")
+        dut._log.debug("  Key injected at T-%sns", offset_ns)
         
         # Wait for the rising edge where key should be sampled
         await RisingEdge(dut.clk)
         await Timer(1, unit="ns")  # Small delay for combinational propagation
         
         # Verify authorization occurred
-        seg_out = int(dut.uo_out.value)
-        glow_out = int(dut.uio_out.value)
+        seg_out, glow_out = read_outputs(dut)
         
         assert seg_out == SEG_VERIFIED, \
-            f"PRE-EDGE TIMING FAILURE at T-{offset_ns}ns: Expected VERIFIED ({hex(SEG_VERIFIED)}), got {hex(seg_out)}"
+            f"PRE-EDGE TIMING FAILURE at T-{offset_ns}ns: Expected VERIFIED ({SEG_VERIFIED_HEX}), got {hex(seg_out)}"
         assert glow_out == GLOW_ACTIVE, \
-            f"PRE-EDGE GLOW FAILURE at T-{offset_ns}ns: Expected ACTIVE ({hex(GLOW_ACTIVE)}), got {hex(glow_out)}"
+            f"PRE-EDGE GLOW FAILURE at T-{offset_ns}ns: Expected ACTIVE ({GLOW_ACTIVE_HEX}), got {hex(glow_out)}"
         
         dut._log.info(f"  [PASS] Correct authorization at T-{offset_ns}ns pre-edge")
         
@@ -120,8 +199,7 @@ async def test_timing_attack_pre_edge(dut):
 # ============================================================================
 # TEST 2: TIMING-ATTACK SIMULATION — POST-EDGE KEY INJECTION
 # ============================================================================
-@cocotb.test()
-async def test_timing_attack_post_edge(dut):
+async def sweep_post_edge(dut, offsets):
     """
     TIMING ATTACK TEST 2: Post-Edge Key Injection
     
@@ -136,52 +214,22 @@ async def test_timing_attack_post_edge(dut):
     dut._log.info("PROSECUTOR TEST 2: POST-EDGE KEY INJECTION TIMING ATTACK")
     dut._log.info("="*72)
     
-    clock = Clock(dut.clk, CLOCK_PERIOD_NS, unit="ns")
-    cocotb.start_soon(clock.start())
-    await reset_sentinel(dut)
-    
-    # Test various post-edge injection timings
-    # Inject at T+1ns, T+5ns, T+10ns, T+20ns after rising edge
-    post_edge_offsets = [1, 5, 10, 20, 30]
-    
-    for offset_ns in post_edge_offsets:
+    for offset_ns in offsets:
         dut._log.info(f"\n--- Testing key injection {offset_ns}ns after rising edge ---")
         
-        # Start with locked state
-        dut.ui_in.value = 0x00
-        await ClockCycles(dut.clk, 2)
-        
-        # Wait for rising edge
-        await RisingEdge(dut.clk)
+        # Start with locked state, aligned to a rising edge
+        await locked_baseline(dut, align=True)
         
         # Inject key AFTER the rising edge
         await Timer(offset_ns, unit="ns")
         dut.ui_in.value = VAELIX_KEY
-        dut._log.info(f"  Key injected at T+{offset_ns}ns")
+        dut._log.debug("  Key injected at T+%sns", offset_ns)
         
-        # Since this is combinational logic, output should change immediately
-        # Wait for propagation delay
-        await Timer(2, unit="ns")
-        
-        # Verify authorization occurred (combinational response)
-        seg_out = int(dut.uo_out.value)
-        glow_out = int(dut.uio_out.value)
-        
-        assert seg_out == SEG_VERIFIED, \
-            f"POST-EDGE FAILURE at T+{offset_ns}ns: Expected VERIFIED ({hex(SEG_VERIFIED)}), got {hex(seg_out)}"
-        assert glow_out == GLOW_ACTIVE, \
-            f"POST-EDGE GLOW FAILURE at T+{offset_ns}ns: Expected ACTIVE ({hex(GLOW_ACTIVE)}), got {hex(glow_out)}"
+        # Verify the combinational response, then clear and verify re-lock
+        await sample_and_clear(dut, "POST-EDGE", f"T+{offset_ns}ns")
         
         dut._log.info(f"  [PASS] Correct combinational response at T+{offset_ns}ns post-edge")
         
-        # Clear key and verify re-lock
-        dut.ui_in.value = 0x00
-        await Timer(2, unit="ns")
-        
-        seg_out = int(dut.uo_out.value)
-        assert seg_out == SEG_LOCKED, \
-            f"POST-EDGE RE-LOCK FAILURE: Expected LOCKED ({hex(SEG_LOCKED)}), got {hex(seg_out)}"
-        
         await ClockCycles(dut.clk, 1)
     
     dut._log.info("\nPROSECUTOR TEST 2: COMPLETE — No post-edge timing vulnerabilities")
@@ -190,8 +238,7 @@ async def test_timing_attack_post_edge(dut):
 # ============================================================================
 # TEST 3: TIMING-ATTACK SIMULATION — FALLING EDGE KEY INJECTION
 # ============================================================================
-@cocotb.test()
-async def test_timing_attack_falling_edge(dut):
+async def sweep_falling_edge(dut, offsets):
     """
     TIMING ATTACK TEST 3: Falling Edge Key Injection
     
@@ -206,20 +253,12 @@ async def test_timing_attack_falling_edge(dut):
     dut._log.info("PROSECUTOR TEST 3: FALLING-EDGE KEY INJECTION TIMING ATTACK")
     dut._log.info("="*72)
     
-    clock = Clock(dut.clk, CLOCK_PERIOD_NS, unit="ns")
-    cocotb.start_soon(clock.start())
-    await reset_sentinel(dut)
-    
-    # Test key injection at falling edge and near-falling edge
-    falling_offsets = [-5, -2, 0, 2, 5]  # ns relative to falling edge
-    
-    for offset_ns in falling_offsets:
+    for offset_ns in offsets:
         offset_str = f"T_fall{offset_ns:+d}ns"
         dut._log.info(f"\n--- Testing key injection at {offset_str} ---")
         
         # Start locked
-        dut.ui_in.value = 0x00
-        await ClockCycles(dut.clk, 2)
+        await locked_baseline(dut)
         
         # Wait for falling edge
         await FallingEdge(dut.clk)
@@ -230,29 +269,16 @@ async def test_timing_attack_falling_edge(dut):
         
         # Inject key
         dut.ui_in.value = VAELIX_KEY
-        dut._log.info(f"  Key injected at {offset_str}")
+        dut._log.debug("  Key injected at %s", offset_str)
         
         if offset_ns > 0:
             await Timer(offset_ns, unit="ns")
         
-        # Wait for combinational propagation
-        await Timer(2, unit="ns")
-        
-        # Verify response (should work as it's combinational)
-        seg_out = int(dut.uo_out.value)
-        glow_out = int(dut.uio_out.value)
-        
-        assert seg_out == SEG_VERIFIED, \
-            f"FALLING-EDGE FAILURE at {offset_str}: Expected VERIFIED ({hex(SEG_VERIFIED)}), got {hex(seg_out)}"
-        assert glow_out == GLOW_ACTIVE, \
-            f"FALLING-EDGE GLOW FAILURE at {offset_str}: Expected ACTIVE ({hex(GLOW_ACTIVE)}), got {hex(glow_out)}"
+        # Verify response (should work as it's combinational), then clear
+        await sample_and_clear(dut, "FALLING-EDGE", offset_str)
         
         dut._log.info(f"  [PASS] Correct response at {offset_str}")
         
-        # Clear and verify
-        dut.ui_in.value = 0x00
-        await Timer(2, unit="ns")
-        assert int(dut.uo_out.value) == SEG_LOCKED
         await ClockCycles(dut.clk, 1)
     
     dut._log.info("\nPROSECUTOR TEST 3: COMPLETE — No falling-edge vulnerabilities")
@@ -261,8 +287,7 @@ async def test_timing_attack_falling_edge(dut):
 # ============================================================================
 # TEST 4: METASTABILITY ATTACK — BIT-BY-BIT TEMPORAL INJECTION
 # ============================================================================
-@cocotb.test()
-async def test_timing_attack_bit_by_bit(dut):
+async def sweep_bit_by_bit(dut, delays):
     """
     TIMING ATTACK TEST 4: Bit-by-Bit Temporal Injection (Metastability)
     
@@ -277,43 +302,28 @@ async def test_timing_attack_bit_by_bit(dut):
     dut._log.info("PROSECUTOR TEST 4: BIT-BY-BIT TEMPORAL INJECTION ATTACK")
     dut._log.info("="*72)
     
-    clock = Clock(dut.clk, CLOCK_PERIOD_NS, unit="ns")
-    cocotb.start_soon(clock.start())
-    await reset_sentinel(dut)
-    
-    # Test injecting key bits with various delays between them
-    bit_delays = [1, 2, 5, 10]  # nanoseconds between bit injections
-    
-    for delay_ns in bit_delays:
+    for delay_ns in delays:
         dut._log.info(f"\n--- Testing bit-by-bit injection with {delay_ns}ns delay ---")
         
-        # Start locked
-        dut.ui_in.value = 0x00
-        await ClockCycles(dut.clk, 2)
-        await RisingEdge(dut.clk)
+        # Start locked, aligned to a rising edge
+        await locked_baseline(dut, align=True)
         
-        # Inject key bits one at a time
-        partial_key = 0x00
-        for bit in range(8):
-            if (VAELIX_KEY >> bit) & 1:
-                partial_key |= (1 << bit)
-            
+        # Inject key bits one at a time; partial keys must not unlock and
+        # the last one (the full key) must
+        for bit, (partial_key, expected) in enumerate(zip(PARTIAL_KEYS, PARTIAL_EXPECTED)):
             dut.ui_in.value = partial_key
-            dut._log.info(f"  Injected bit {bit}: partial_key = {hex(partial_key)}")
+            dut._log.debug("  Injected bit %d: partial_key = %#x", bit, partial_key)
             
             await Timer(delay_ns, unit="ns")
             
-            # Check that partial keys don't unlock
             seg_out = int(dut.uo_out.value)
-            if partial_key != VAELIX_KEY:
-                assert seg_out == SEG_LOCKED, \
-                    f"PARTIAL KEY LEAK at bit {bit} (partial={hex(partial_key)}): Got {hex(seg_out)}"
-            else:
-                # Last bit completes the key
-                assert seg_out == SEG_VERIFIED, \
-                    f"FULL KEY REJECTION at bit {bit}: Expected VERIFIED, got {hex(seg_out)}"
+            assert seg_out == expected, \
+                (f"PARTIAL KEY LEAK at bit {bit} (partial={hex(partial_key)}): Got {hex(seg_out)}"
+                 if expected == SEG_LOCKED else
+                 f"FULL KEY REJECTION at bit {bit}: Expected VERIFIED, got {hex(seg_out)}")
         
-        dut._log.info(f"  [PASS] No partial key acceptance with {delay_ns}ns bit delay")
+        dut._log.info(f"  [PASS] No partial key acceptance with {delay_ns}ns bit delay "
+                      f"({len(PARTIAL_KEYS) - 1} partial keys rejected)")
         
         # Clear
         dut.ui_in.value = 0x00
@@ -325,8 +335,7 @@ async def test_timing_attack_bit_by_bit(dut):
 # ============================================================================
 # TEST 5: GLITCH ATTACK — RAPID KEY TOGGLING
 # ============================================================================
-@cocotb.test()
-async def test_timing_attack_rapid_toggle(dut):
+async def sweep_rapid_toggle(dut, periods):
     """
     TIMING ATTACK TEST 5: Rapid Key Toggling (Glitch Attack)
     
@@ -341,35 +350,22 @@ async def test_timing_attack_rapid_toggle(dut):
     dut._log.info("PROSECUTOR TEST 5: RAPID KEY TOGGLING (GLITCH ATTACK)")
     dut._log.info("="*72)
     
-    clock = Clock(dut.clk, CLOCK_PERIOD_NS, unit="ns")
-    cocotb.start_soon(clock.start())
-    await reset_sentinel(dut)
-    
-    # Test various toggle periods
-    toggle_periods = [10, 5, 3, 2, 1]  # nanoseconds
-    
-    for period_ns in toggle_periods:
+    for period_ns in periods:
         dut._log.info(f"\n--- Testing rapid toggle with {period_ns}ns period ---")
         
-        dut.ui_in.value = 0x00
-        await ClockCycles(dut.clk, 2)
+        await locked_baseline(dut)
         
         # Perform rapid toggles
         num_toggles = 20
         for i in range(num_toggles):
-            dut.ui_in.value = VAELIX_KEY if (i % 2 == 0) else 0x00
+            dut.ui_in.value = TOGGLE_KEYS[i & 1]
             await Timer(period_ns, unit="ns")
         
         # After glitching, verify system is in correct state based on final input
         await Timer(5, unit="ns")  # Let combinational logic settle
         
         final_seg = int(dut.uo_out.value)
-        final_input = int(dut.ui_in.value)
-        
-        if final_input == VAELIX_KEY:
-            expected = SEG_VERIFIED
-        else:
-            expected = SEG_LOCKED
+        expected = TOGGLE_EXPECTED[i & 1]
         
         assert final_seg == expected, \
             f"GLITCH STATE CORRUPTION with {period_ns}ns toggles: Expected {hex(expected)}, got {hex(final_seg)}"
@@ -386,8 +382,7 @@ async def test_timing_attack_rapid_toggle(dut):
 # ============================================================================
 # TEST 6: CLOCK PHASE ATTACK — KEY INJECTION AT ALL CLOCK PHASES
 # ============================================================================
-@cocotb.test()
-async def test_timing_attack_all_clock_phases(dut):
+async def sweep_all_clock_phases(dut, offsets):
     """
     TIMING ATTACK TEST 6: Exhaustive Clock Phase Sweep
     
@@ -402,24 +397,16 @@ async def test_timing_attack_all_clock_phases(dut):
     dut._log.info("PROSECUTOR TEST 6: EXHAUSTIVE CLOCK PHASE SWEEP")
     dut._log.info("="*72)
     
-    clock = Clock(dut.clk, CLOCK_PERIOD_NS, unit="ns")
-    cocotb.start_soon(clock.start())
-    await reset_sentinel(dut)
+    # One LOCKED baseline for the whole sweep, then one phase per clock
+    # cycle: every phase ends on the complement key with LOCKED asserted,
+    # which is the locked state the next phase injects from.
+    await locked_baseline(dut)
     
-    # Test 8 phases across the full clock period
-    num_phases = 8
-    phase_step = CLOCK_PERIOD_NS // num_phases
-    
-    for phase in range(num_phases):
-        phase_offset_ns = phase * phase_step
-        phase_degrees = (phase * 360) // num_phases
+    for phase_offset_ns in offsets:
+        phase_degrees = (phase_offset_ns * 360) // CLOCK_PERIOD_NS
         
         dut._log.info(f"\n--- Testing phase {phase_degrees}° (T+{phase_offset_ns}ns) ---")
         
-        # Start locked
-        dut.ui_in.value = 0x00
-        await ClockCycles(dut.clk, 2)
-        
         # Align to rising edge
         await RisingEdge(dut.clk)
         
@@ -429,33 +416,17 @@ async def test_timing_attack_all_clock_phases(dut):
         
         # Inject key at this phase
         dut.ui_in.value = VAELIX_KEY
-        dut._log.info(f"  Key injected at phase {phase_degrees}° (T+{phase_offset_ns}ns)")
+        dut._log.debug("  Key injected at phase %d° (T+%dns)", phase_degrees, phase_offset_ns)
         
-        # Wait for combinational propagation
-        await Timer(2, unit="ns")
-        
-        # Verify authorization
-        seg_out = int(dut.uo_out.value)
-        glow_out = int(dut.uio_out.value)
-        
-        assert seg_out == SEG_VERIFIED, \
-            f"PHASE ATTACK FAILURE at {phase_degrees}°: Expected VERIFIED ({hex(SEG_VERIFIED)}), got {hex(seg_out)}"
-        assert glow_out == GLOW_ACTIVE, \
-            f"PHASE GLOW FAILURE at {phase_degrees}°: Expected ACTIVE ({hex(GLOW_ACTIVE)}), got {hex(glow_out)}"
+        # Verify authorization, then the invalid complement key (0x49) at
+        # the same phase must lock
+        await sample_and_clear(dut, "PHASE", f"{phase_degrees}°", clear_key=0x49)
         
         dut._log.info(f"  [PASS] Correct response at phase {phase_degrees}°")
-        
-        # Test invalid key at same phase
-        dut.ui_in.value = 0x49  # Complement of valid key
-        await Timer(2, unit="ns")
-        
-        seg_out = int(dut.uo_out.value)
-        assert seg_out == SEG_LOCKED, \
-            f"PHASE LOCK FAILURE at {phase_degrees}°: Expected LOCKED ({hex(SEG_LOCKED)}), got {hex(seg_out)}"
-        
-        # Clear
-        dut.ui_in.value = 0x00
-        await ClockCycles(dut.clk, 1)
+    
+    # Clear
+    dut.ui_in.value = 0x00
+    await ClockCycles(dut.clk, 1)
     
     dut._log.info("\nPROSECUTOR TEST 6: COMPLETE — Clock-phase independent operation confirmed")
 
@@ -463,8 +434,7 @@ async def test_timing_attack_all_clock_phases(dut):
 # ============================================================================
 # TEST 7: SETUP/HOLD TIME VIOLATION ATTACK
 # ============================================================================
-@cocotb.test()
-async def test_timing_attack_setup_hold_violation(dut):
+async def sweep_setup_hold_violation(dut, offsets):
     """
     TIMING ATTACK TEST 7: Setup/Hold Time Violation Attack
     
@@ -474,43 +444,36 @@ async def test_timing_attack_setup_hold_violation(dut):
     ATTACK VECTOR: Key changes at t_setup and t_hold boundaries
     EXPECTED: System remains secure; no unauthorized states from violations
     SECURITY PROPERTY: Robust handling of timing violations
+    
+    Offsets are at or after the rising edge only: cocotb's Timer runs
+    forward, so a change before the edge being sampled cannot be placed
+    from that edge. Pre-edge setup violations need a gate-level run with
+    back-annotated delays.
     """
     dut._log.info("="*72)
     dut._log.info("PROSECUTOR TEST 7: SETUP/HOLD TIME VIOLATION ATTACK")
     dut._log.info("="*72)
     
-    clock = Clock(dut.clk, CLOCK_PERIOD_NS, unit="ns")
-    cocotb.start_soon(clock.start())
-    await reset_sentinel(dut)
-    
-    # Test key changes very close to rising edge
-    # Typical setup/hold times are in picoseconds to low nanoseconds
-    violation_offsets = [-0.5, -0.2, 0, 0.2, 0.5]  # ns relative to rising edge
-    
-    for offset_ns in violation_offsets:
+    for offset_ns in offsets:
         offset_str = f"{offset_ns:+.1f}ns"
         dut._log.info(f"\n--- Testing key change at rising_edge {offset_str} ---")
         
         # Start with valid key
         dut.ui_in.value = VAELIX_KEY
-        await ClockCycles(dut.clk, 2)
+        await wait_cycles(dut.clk, 2)
         
-        # Wait until just before/at/after rising edge
+        # Wait until at/after rising edge
         await RisingEdge(dut.clk)
-        if offset_ns < 0:
-            # Go back in time by waiting and then changing
-            # (approximation since we can't actually go back)
-            pass
-        elif offset_ns > 0:
+        if offset_ns > 0:
             await Timer(offset_ns, unit="ns")
         
         # Change to invalid key at violation point
         dut.ui_in.value = 0x00
-        dut._log.info(f"  Key changed to 0x00 at {offset_str}")
+        dut._log.debug("  Key changed to 0x00 at %s", offset_str)
         
         # Wait for next clock cycle to sample
         await ClockCycles(dut.clk, 1)
-        await Timer(2, unit="ns")
+        await Timer(SETTLE_NS, unit="ns")
         
         # System should be locked (combinational, immediate response)
         seg_out = int(dut.uo_out.value)
@@ -524,6 +487,44 @@ async def test_timing_attack_setup_hold_violation(dut):
     dut._log.info("\nPROSECUTOR TEST 7: COMPLETE — No setup/hold violation exploits")
 
 
+# ============================================================================
+# TESTS 1-7: SWEEP TABLE — ONE PARAMETRIZED TEST PER TIMING SWEEP
+# ============================================================================
+# Each row becomes its own cocotb test, named after its sweep function
+# (test_timing_attack_sweeps/sweep=sweep_pre_edge/...), so a failing sweep
+# does not stop the others and each can be filtered or sharded on its own;
+# all of them still share one simulator run.
+#   (sweep, values swept in ns)
+TIMING_SWEEPS = (
+    # Injection before the next rising edge: T-30 .. T-1
+    (sweep_pre_edge,             (30, 20, 10, 5, 2, 1)),
+    # Injection after the rising edge: T+1 .. T+30
+    (sweep_post_edge,            (1, 5, 10, 20, 30)),
+    # Injection around the falling edge
+    (sweep_falling_edge,         (-5, -2, 0, 2, 5)),
+    # Spacing between successive key-bit injections
+    (sweep_bit_by_bit,           (1, 2, 5, 10)),
+    # Half-period of the valid/invalid key toggle
+    (sweep_rapid_toggle,         (10, 5, 3, 2, 1)),
+    # 8 phases across the clock period, 0° .. 315°
+    (sweep_all_clock_phases,     tuple(range(0, CLOCK_PERIOD_NS, CLOCK_PERIOD_NS // 8))),
+    # Key change at/after the rising edge (hold window)
+    (sweep_setup_hold_violation, (0, 0.2, 0.5)),
+)
+
+
+@cocotb.test()
+@cocotb.parametrize((("sweep", "values"), TIMING_SWEEPS))
+async def test_timing_attack_sweeps(dut, sweep, values):
+    """
+    TIMING ATTACK TESTS 1-7: one offset/delay sweep from TIMING_SWEEPS,
+    from its own clock start and reset.
+    """
+    await setup_clock(dut)
+    dut._log.info(f"SWEEP {sweep.__name__}: {len(values)} points")
+    await sweep(dut, values)
+
+
 # ============================================================================
 # TEST 8: EDGE CASE — SIMULTANEOUS KEY AND RESET
 # ============================================================================
@@ -543,14 +544,13 @@ async def test_timing_attack_key_with_reset(dut):
     dut._log.info("PROSECUTOR TEST 8: SIMULTANEOUS KEY AND RESET ATTACK")
     dut._log.info("="*72)
     
-    clock = Clock(dut.clk, CLOCK_PERIOD_NS, unit="ns")
-    cocotb.start_soon(clock.start())
-    await reset_sentinel(dut)
+    await setup_clock(dut)
     
     # Test 1: Apply key during reset assertion
     dut._log.info("\n--- Test 1: Key applied during reset assertion ---")
+    # The reset sequence below is clocked, so start it from an edge
     dut.ui_in.value = 0x00
-    await ClockCycles(dut.clk, 2)
+    await wait_cycles(dut.clk, 2)
     
     dut.rst_n.value = 0  # Assert reset
     dut.ui_in.value = VAELIX_KEY  # Apply key simultaneously
@@ -634,21 +634,24 @@ async def test_timing_attack_clock_frequency_variation(dut):
         (50, 20),    # 50 MHz, 20ns period
     ]
     
-    for freq_mhz, period_ns in test_frequencies:
+    for index, (freq_mhz, period_ns) in enumerate(test_frequencies):
         dut._log.info(f"\n--- Testing at {freq_mhz}MHz (period={period_ns}ns) ---")
         
         # Create new clock with this frequency
         clock = Clock(dut.clk, period_ns, unit="ns")
         cocotb.start_soon(clock.start())
         
-        # Reset
-        dut.ena.value = 1
-        dut.ui_in.value = 0
-        dut.uio_in.value = 0
-        dut.rst_n.value = 0
-        await ClockCycles(dut.clk, 10)
-        dut.rst_n.value = 1
-        await ClockCycles(dut.clk, 2)
+        # Reset once, under the first clock; each later frequency picks
+        # up from the LOCKED state the previous one ended in, which its
+        # own LOCKED check below confirms
+        if index == 0:
+            dut.ena.value = Immediate(1)
+            dut.ui_in.value = Immediate(0)
+            dut.uio_in.value = Immediate(0)
+            dut.rst_n.value = Immediate(0)
+            await ClockCycles(dut.clk, 10)
+            dut.rst_n.value = 1
+            await ClockCycles(dut.clk, 2)
         
         # Test locked state
         dut.ui_in.value = 0x00
@@ -656,7 +659,7 @@ async def test_timing_attack_clock_frequency_variation(dut):
         
         seg_out = int(dut.uo_out.value)
         assert seg_out == SEG_LOCKED, \
-            f"FREQUENCY ATTACK at {freq_mhz}MHz LOCKED: Expected {hex(SEG_LOCKED)}, got {hex(seg_out)}"
+            f"FREQUENCY ATTACK at {freq_mhz}MHz LOCKED: Expected {SEG_LOCKED_HEX}, got {hex(seg_out)}"
         
         dut._log.info(f"  [PASS] Correct LOCKED state at {freq_mhz}MHz")
         
@@ -664,13 +667,12 @@ async def test_timing_attack_clock_frequency_variation(dut):
         dut.ui_in.value = VAELIX_KEY
         await ClockCycles(dut.clk, 2)
         
-        seg_out = int(dut.uo_out.value)
-        glow_out = int(dut.uio_out.value)
+        seg_out, glow_out = read_outputs(dut)
         
         assert seg_out == SEG_VERIFIED, \
-            f"FREQUENCY ATTACK at {freq_mhz}MHz VERIFIED: Expected {hex(SEG_VERIFIED)}, got {hex(seg_out)}"
+            f"FREQUENCY ATTACK at {freq_mhz}MHz VERIFIED: Expected {SEG_VERIFIED_HEX}, got {hex(seg_out)}"
         assert glow_out == GLOW_ACTIVE, \
-            f"FREQUENCY ATTACK at {freq_mhz}MHz GLOW: Expected {hex(GLOW_ACTIVE)}, got {hex(glow_out)}"
+            f"FREQUENCY ATTACK at {freq_mhz}MHz GLOW: Expected {GLOW_ACTIVE_HEX}, got {hex(glow_out)}"
         
         dut._log.info(f"  [PASS] Correct VERIFIED state at {freq_mhz}MHz")
         
@@ -680,12 +682,14 @@ async def test_timing_attack_clock_frequency_variation(dut):
         
         seg_out = int(dut.uo_out.value)
         assert seg_out == SEG_LOCKED, \
-            f"FREQUENCY ATTACK at {freq_mhz}MHz RE-LOCK: Expected {hex(SEG_LOCKED)}, got {hex(seg_out)}"
+            f"FREQUENCY ATTACK at {freq_mhz}MHz RE-LOCK: Expected {SEG_LOCKED_HEX}, got {hex(seg_out)}"
         
         dut._log.info(f"  [PASS] Correct RE-LOCK at {freq_mhz}MHz")
         
-        # Stop this clock before next iteration
+        # Stop this clock before next iteration starts its own; otherwise
+        # every earlier Clock keeps toggling dut.clk alongside the new one
         await ClockCycles(dut.clk, 2)
+        clock.stop()
     
     dut._log.info("\nPROSECUTOR TEST 9: COMPLETE — Frequency-independent operation confirmed")
 
@@ -709,16 +713,24 @@ async def test_timing_attack_comprehensive_edge_cases(dut):
     dut._log.info("PROSECUTOR TEST 10: COMPREHENSIVE TIMING EDGE CASE BATTERY")
     dut._log.info("="*72)
     
-    clock = Clock(dut.clk, CLOCK_PERIOD_NS, unit="ns")
-    cocotb.start_soon(clock.start())
-    await reset_sentinel(dut)
+    await setup_clock(dut)
+    
+    passed = 0
+    total = 0
+    failed_cases = []
     
-    edge_cases = []
+    def record(case_name, ok):
+        """Count one edge-case result and log it as it comes in."""
+        nonlocal passed, total
+        total += 1
+        passed += ok
+        if not ok:
+            failed_cases.append(case_name)
+        dut._log.info(f"  [{'PASS' if ok else 'FAIL'}] {case_name}")
     
     # Edge Case 1: Zero-duration key pulse
     dut._log.info("\n--- Edge Case 1: Zero-duration key pulse ---")
-    dut.ui_in.value = 0x00
-    await ClockCycles(dut.clk, 2)
+    await locked_baseline(dut)
     
     dut.ui_in.value = VAELIX_KEY
     await Timer(1, unit="ns")  # Minimal pulse (1ns is minimum positive value)
@@ -726,75 +738,63 @@ async def test_timing_attack_comprehensive_edge_cases(dut):
     await Timer(5, unit="ns")
     
     seg_out = int(dut.uo_out.value)
-    edge_cases.append(("Zero-duration pulse", seg_out == SEG_LOCKED))
-    dut._log.info(f"  Zero-duration pulse: {'PASS' if edge_cases[-1][1] else 'FAIL'}")
+    record("Zero-duration pulse", seg_out == SEG_LOCKED)
     
-    await ClockCycles(dut.clk, 2)
+    await wait_cycles(dut.clk, 2)
     
     # Edge Case 2: Key held for exactly one clock cycle
     dut._log.info("\n--- Edge Case 2: Key held for exactly one clock cycle ---")
     await RisingEdge(dut.clk)
     dut.ui_in.value = VAELIX_KEY
     await RisingEdge(dut.clk)
-    await Timer(2, unit="ns")
+    await Timer(SETTLE_NS, unit="ns")
     
     seg_out = int(dut.uo_out.value)
-    edge_cases.append(("One-cycle key hold", seg_out == SEG_VERIFIED))
-    dut._log.info(f"  One-cycle key: {'PASS' if edge_cases[-1][1] else 'FAIL'}")
+    record("One-cycle key hold", seg_out == SEG_VERIFIED)
     
     dut.ui_in.value = 0x00
-    await ClockCycles(dut.clk, 2)
+    await wait_cycles(dut.clk, 2)
     
     # Edge Case 3: Key toggled at exactly clock frequency
     dut._log.info("\n--- Edge Case 3: Key toggled at exactly clock frequency ---")
+    expected = tuple(TOGGLE_EXPECTED[i & 1] for i in range(10))
+    observed = []
     for i in range(10):
         await RisingEdge(dut.clk)
-        dut.ui_in.value = VAELIX_KEY if (i % 2 == 0) else 0x00
-        await Timer(2, unit="ns")
-        
-        seg_out = int(dut.uo_out.value)
-        expected = SEG_VERIFIED if (i % 2 == 0) else SEG_LOCKED
-        if seg_out != expected:
-            edge_cases.append(("Clock-sync toggle", False))
-            break
-    else:
-        edge_cases.append(("Clock-sync toggle", True))
+        dut.ui_in.value = TOGGLE_KEYS[i & 1]
+        await Timer(SETTLE_NS, unit="ns")
+        observed.append(int(dut.uo_out.value))
     
-    dut._log.info(f"  Clock-sync toggle: {'PASS' if edge_cases[-1][1] else 'FAIL'}")
+    record("Clock-sync toggle", tuple(observed) == expected)
     
     dut.ui_in.value = 0x00
-    await ClockCycles(dut.clk, 2)
+    await wait_cycles(dut.clk, 2)
     
     # Edge Case 4: Key applied during power-on (ena transition)
     dut._log.info("\n--- Edge Case 4: Key applied during enable transition ---")
     dut.ena.value = 0
     dut.ui_in.value = VAELIX_KEY
-    await ClockCycles(dut.clk, 2)
+    await wait_cycles(dut.clk, 2)
     
     dut.ena.value = 1
-    await ClockCycles(dut.clk, 2)
+    await wait_cycles(dut.clk, 2)
     
     seg_out = int(dut.uo_out.value)
-    edge_cases.append(("Enable transition with key", seg_out == SEG_VERIFIED))
-    dut._log.info(f"  Enable transition: {'PASS' if edge_cases[-1][1] else 'FAIL'}")
+    record("Enable transition with key", seg_out == SEG_VERIFIED)
     
     dut.ui_in.value = 0x00
-    await ClockCycles(dut.clk, 2)
+    await wait_cycles(dut.clk, 2)
     
     # Edge Case 5: Alternating bits of key applied sequentially
     dut._log.info("\n--- Edge Case 5: Alternating bit injection ---")
-    dut.ui_in.value = 0x00
-    await ClockCycles(dut.clk, 2)
+    await locked_baseline(dut)
     
     # Apply even bits first, then odd bits
-    even_bits = VAELIX_KEY & 0xAA  # 0b10101010
-    odd_bits = VAELIX_KEY & 0x55   # 0b01010101
-    
-    dut.ui_in.value = even_bits
+    dut.ui_in.value = KEY_EVEN_BITS
     await ClockCycles(dut.clk, 1)
     seg_out_even = int(dut.uo_out.value)
     
-    dut.ui_in.value = odd_bits
+    dut.ui_in.value = KEY_ODD_BITS
     await ClockCycles(dut.clk, 1)
     seg_out_odd = int(dut.uo_out.value)
     
@@ -803,26 +803,18 @@ async def test_timing_attack_comprehensive_edge_cases(dut):
     seg_out_full = int(dut.uo_out.value)
     
     alt_ok = (seg_out_even == SEG_LOCKED and seg_out_odd == SEG_LOCKED and seg_out_full == SEG_VERIFIED)
-    edge_cases.append(("Alternating bit injection", alt_ok))
-    dut._log.info(f"  Alternating bits: {'PASS' if alt_ok else 'FAIL'}")
+    record("Alternating bit injection", alt_ok)
     
     dut.ui_in.value = 0x00
-    await ClockCycles(dut.clk, 2)
+    await wait_cycles(dut.clk, 2)
     
     # Summary
     dut._log.info("\n" + "="*72)
     dut._log.info("EDGE CASE SUMMARY:")
-    passed = sum(1 for _, result in edge_cases if result)
-    total = len(edge_cases)
-    
-    for case_name, result in edge_cases:
-        status = "PASS" if result else "FAIL"
-        dut._log.info(f"  [{status}] {case_name}")
-    
-    dut._log.info(f"\nTotal: {passed}/{total} edge cases passed")
+    dut._log.info(f"  Total: {passed}/{total} edge cases passed")
     
-    assert passed == total, \
-        f"EDGE CASE FAILURES: {total - passed} edge cases failed"
+    assert not failed_cases, \
+        f"EDGE CASE FAILURES: {total - passed} edge cases failed: {', '.join(failed_cases)}"
     
     dut._log.info("\nPROSECUTOR TEST 10: COMPLETE — All edge cases secure")
 
@@ -10,50 +10,53 @@
 
 import cocotb
 from cocotb.clock import Clock
-from cocotb.triggers import ClockCycles, RisingEdge
+from cocotb.handle import Immediate
+from cocotb.triggers import ClockCycles, FallingEdge, RisingEdge
 
 # ============================================================================
 # MISSION CONSTANTS
 # ============================================================================
 VAELIX_KEY = 0xB6
 CLOCK_PERIOD_NS = 40
+RESET_HOLD_CYCLES = 2
+VAELIX_KEY_HEX = f"0x{VAELIX_KEY:02X}"   # Log/message text for the key
 
 
 # ============================================================================
 # HELPER FUNCTIONS
 # ============================================================================
 
-async def reset_sentinel(dut):
-    """Initialize the Sentinel to known state."""
-    dut.ena.value = 1
-    dut.rst_n.value = 0
-    dut.ui_in.value = 0x00
-    dut.uio_in.value = 0x00
-    await ClockCycles(dut.clk, 2)
-    dut.rst_n.value = 1
-    await ClockCycles(dut.clk, 1)
+def start_clock(dut):
+    """Start the 25 MHz system clock; cocotb cancels it when the test ends."""
+    cocotb.start_soon(Clock(dut.clk, CLOCK_PERIOD_NS, unit="ns").start())
 
 
-def count_toggles(dut, signal_name):
+async def reset_sentinel(dut):
     """
-    Count the number of bit transitions in a signal.
-    This approximates power consumption — more toggles = more power.
+    Initialize the Sentinel to known state.
+    Pin values are written immediately (cocotb 2.0 Immediate) so they
+    are in place before the freshly started clock's first edge.
     """
-    # Get the signal
-    signal = getattr(dut, signal_name)
-    
-    # For internal wires, we need to access the value
-    try:
-        value = int(signal.value)
-    except:
-        return 0
-    
-    # Count toggles by comparing consecutive bits
-    toggles = 0
-    prev_val = value
-    
-    # Return the value for now (we'll measure across clock cycles)
-    return value
+    dut.ena.value = Immediate(1)
+    dut.rst_n.value = Immediate(0)
+    dut.ui_in.value = Immediate(0x00)
+    dut.uio_in.value = Immediate(0x00)
+    dut.reset_hold.value = Immediate(RESET_HOLD_CYCLES)
+    await RisingEdge(dut.rst_n)  # tb.v releases rst_n after RESET_HOLD_CYCLES
+    await ClockCycles(dut.clk, 1)
+
+
+# Internal comparator nets sampled by measure_power_consumption, resolved
+# once per simulation; None marks a net this build does not expose.
+_SIGNALS = {}
+
+
+def _resolve_signals(dut):
+    """Look up the comparator nets under dut.user_project on first use."""
+    if _SIGNALS:
+        return
+    for name in ("diff", "any_diff", "is_authorized"):
+        _SIGNALS[name] = getattr(dut.user_project, name, None)
 
 
 async def measure_power_consumption(dut, test_value):
@@ -62,6 +65,8 @@ async def measure_power_consumption(dut, test_value):
     
     Returns: Dictionary with toggle counts for key signals.
     """
+    _resolve_signals(dut)
+    
     # Set the test value
     dut.ui_in.value = test_value
     
@@ -70,13 +75,15 @@ async def measure_power_consumption(dut, test_value):
     
     # Sample internal signals
     try:
-        diff_value = int(dut.user_project.diff.value) if hasattr(dut.user_project, 'diff') else 0
-        any_diff_value = int(dut.user_project.any_diff.value) if hasattr(dut.user_project, 'any_diff') else 0
-        is_auth_value = int(dut.user_project.is_authorized.value)
+        diff_h = _SIGNALS['diff']
+        any_diff_h = _SIGNALS['any_diff']
+        diff_value = int(diff_h.value) if diff_h is not None else 0
+        any_diff_value = int(any_diff_h.value) if any_diff_h is not None else 0
+        is_auth_value = int(_SIGNALS['is_authorized'].value)
         
         # Count active signals (transitions from ground state)
         # Power consumption approximation: sum of all active bits
-        power_metric = bin(diff_value).count('1') + any_diff_value + is_auth_value
+        power_metric = diff_value.bit_count() + any_diff_value + is_auth_value
         
         return {
             'input': test_value,
@@ -109,30 +116,26 @@ async def test_power_analysis_0x00_vs_0xFF(dut):
     dut._log.info("KAMKAR EQUALIZER: Power Analysis Test (0x00 vs 0xFF)")
     dut._log.info("=" * 72)
     
-    # Setup
-    clock = Clock(dut.clk, CLOCK_PERIOD_NS, unit="ns")
-    cocotb.start_soon(clock.start())
+    start_clock(dut)
     await reset_sentinel(dut)
     
-    # Measure power for 0x00
-    dut._log.info("Testing 0x00 (all zeros)...")
-    power_0x00 = await measure_power_consumption(dut, 0x00)
-    dut._log.info(f"  0x00 metrics: {power_0x00}")
-    
-    # Measure power for 0xFF
-    dut._log.info("Testing 0xFF (all ones)...")
-    power_0xFF = await measure_power_consumption(dut, 0xFF)
-    dut._log.info(f"  0xFF metrics: {power_0xFF}")
-    
-    # Measure power for the correct key
-    dut._log.info(f"Testing 0x{VAELIX_KEY:02X} (correct key)...")
-    power_key = await measure_power_consumption(dut, VAELIX_KEY)
-    dut._log.info(f"  0x{VAELIX_KEY:02X} metrics: {power_key}")
-    
-    # Verify both incorrect keys were rejected
-    assert power_0x00['is_authorized'] == 0, "0x00 should be rejected"
-    assert power_0xFF['is_authorized'] == 0, "0xFF should be rejected"
-    assert power_key['is_authorized'] == 1, f"0x{VAELIX_KEY:02X} should be accepted"
+    # Stream 0x00 (all zeros), 0xFF (all ones) and the correct key through
+    # on consecutive cycles; only the key may authorize
+    test_cases = (
+        (0x00,       "all zeros",   0),
+        (0xFF,       "all ones",    0),
+        (VAELIX_KEY, "correct key", 1),
+    )
+    measured = []
+    for test_val, label, _ in test_cases:
+        dut._log.info(f"Testing 0x{test_val:02X} ({label})...")
+        metrics = await measure_power_consumption(dut, test_val)
+        dut._log.info(f"  0x{test_val:02X} metrics: {metrics}")
+        measured.append(metrics['is_authorized'])
+    
+    expected = [auth for _, _, auth in test_cases]
+    assert measured == expected, \
+        f"is_authorized for 0x00, 0xFF, {VAELIX_KEY_HEX}: expected {expected}, got {measured}"
     
     # Calculate the number of differing bits in the diff signal
     # For 0x00: diff = 0x00 ^ 0xB6 = 0xB6 (has 5 ones)
@@ -171,33 +174,26 @@ async def test_power_analysis_sweep(dut):
     dut._log.info("KAMKAR EQUALIZER: Full Sweep Test (all 256 inputs)")
     dut._log.info("=" * 72)
     
-    # Setup
-    clock = Clock(dut.clk, CLOCK_PERIOD_NS, unit="ns")
-    cocotb.start_soon(clock.start())
+    start_clock(dut)
     await reset_sentinel(dut)
     
-    authorized_count = 0
-    rejected_count = 0
-    
-    # Test all possible 8-bit values
-    for test_val in range(256):
-        dut.ui_in.value = test_val
-        await ClockCycles(dut.clk, 1)
-        
-        is_auth = int(dut.user_project.is_authorized.value)
-        
-        if test_val == VAELIX_KEY:
-            assert is_auth == 1, f"Key 0x{test_val:02X} should be authorized"
-            authorized_count += 1
-        else:
-            assert is_auth == 0, f"Key 0x{test_val:02X} should be rejected"
-            rejected_count += 1
+    # Test all possible 8-bit values; only the key may authorize.
+    # ui_in is 0x00 from reset; tb.v steps it once per clock up to 0xFF
+    # and sets sweep_auth_err if is_authorized ever disagrees with
+    # (ui_in == key), latching the first such input in sweep_auth_key,
+    # so the sweep needs no per-value Python check.
+    dut.sweep_en.value = 1
+    await RisingEdge(dut.sweep_done)
+    await FallingEdge(dut.clk)  # Let the last step's flags settle
+    auth_err = int(dut.sweep_auth_err.value)
+    bad_key = int(dut.sweep_auth_key.value)
+    dut.sweep_en.value = 0
     
-    dut._log.info(f"Authorized: {authorized_count} (expected: 1)")
-    dut._log.info(f"Rejected: {rejected_count} (expected: 255)")
+    assert auth_err == 0, \
+        f"is_authorized disagreed with (ui_in == {VAELIX_KEY_HEX}) " \
+        f"at ui_in = 0x{bad_key:02X} (first mismatch of the sweep)"
     
-    assert authorized_count == 1, "Exactly one key should be authorized"
-    assert rejected_count == 255, "Exactly 255 keys should be rejected"
+    dut._log.info("Authorized: only the key (1 of 256)")
     
     dut._log.info("")
     dut._log.info("[PASS] All 256 inputs tested — bitslicing comparator functional")
@@ -216,9 +212,7 @@ async def test_bitslicing_structure(dut):
     dut._log.info("KAMKAR EQUALIZER: Structure Verification")
     dut._log.info("=" * 72)
     
-    # Setup
-    clock = Clock(dut.clk, CLOCK_PERIOD_NS, unit="ns")
-    cocotb.start_soon(clock.start())
+    start_clock(dut)
     await reset_sentinel(dut)
     
     # Test case 1: Perfect match (correct key)
@@ -230,7 +224,7 @@ async def test_bitslicing_structure(dut):
     any_diff = int(dut.user_project.any_diff.value)
     is_auth = int(dut.user_project.is_authorized.value)
     
-    dut._log.info(f"  ui_in = 0x{VAELIX_KEY:02X}")
+    dut._log.info(f"  ui_in = {VAELIX_KEY_HEX}")
     dut._log.info(f"  diff = 0x{diff:02X} (should be 0x00)")
     dut._log.info(f"  any_diff = {any_diff} (should be 0)")
     dut._log.info(f"  is_authorized = {is_auth} (should be 1)")
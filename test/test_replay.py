@@ -9,8 +9,8 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import cocotb
-from cocotb.clock import Clock
-from cocotb.triggers import ClockCycles
+from cocotb.handle import Immediate
+from cocotb.triggers import ClockCycles, FallingEdge, RisingEdge, Timer
 
 # ============================================================================
 # VAELIX MISSION CONSTANTS
@@ -21,30 +21,65 @@ SEG_VERIFIED    = 0xC1   # 7-Segment 'U' (Active-LOW, Common Anode)
 GLOW_ACTIVE     = 0xFF   # All status LEDs ignited
 GLOW_DORMANT    = 0x00   # All status LEDs dark
 CLOCK_PERIOD_NS = 40     # 25 MHz = 40ns period
+RESET_HOLD_CYCLES = 2   # Clocks rst_n is held low (see tb.v RESET SEQUENCER)
 LOCKOUT_TIME_S  = 10     # Lockout duration in seconds
 LOCKOUT_CYCLES  = int(LOCKOUT_TIME_S * 25_000_000)  # At 25 MHz
 
 
+def start_clock(dut):
+    """
+    Hand the 25 MHz system clock to tb.v's generator (clk_gen), so no
+    Python coroutine wakes on every edge. Unlike a cocotb Clock it keeps
+    running after the test ends; the later tests here simply re-arm it.
+    """
+    dut.clk_gen.value = Immediate(1)
+
+
+async def wait_cycles(clk, n):
+    """
+    Advance n clock cycles from an edge, ending just after the n-th
+    rising edge as ClockCycles(clk, n) does, for waits that observe
+    nothing in between: one Timer to mid-cycle, then the final edge.
+    """
+    if n > 1:
+        await Timer((n - 1) * CLOCK_PERIOD_NS + CLOCK_PERIOD_NS // 2, unit="ns")
+    await RisingEdge(clk)
+
+
 async def reset_sentinel(dut):
     """Standard Power-On Reset sequence for the Sentinel Core."""
     dut.ena.value    = 0
     dut.ui_in.value  = 0
     dut.uio_in.value = 0
     dut.rst_n.value  = 0
-    await ClockCycles(dut.clk, 10)
-    dut.rst_n.value  = 1
-    await ClockCycles(dut.clk, 5)
+    dut.reset_hold.value = RESET_HOLD_CYCLES
+    await RisingEdge(dut.rst_n)  # tb.v releases rst_n after RESET_HOLD_CYCLES
+    await wait_cycles(dut.clk, 5)
+
+
+async def fast_forward_lockout(dut, remaining=4):
+    """
+    Skip to the tail of a REPLAY_LOCKOUT: load the lockout timer with
+    `remaining` cycles (it counts down from LOCKOUT_CYCLES) and run it
+    out, plus the cycle the FSM spends leaving the lockout. Simulating
+    the full LOCKOUT_CYCLES (10 s at 25 MHz) is not practical.
+    The write is made at the falling edge: right after a rising edge
+    the FSM's clocked block has yet to run and would overwrite it.
+    """
+    await FallingEdge(dut.clk)
+    dut.user_project.lockout_timer.value = Immediate(remaining)
+    await ClockCycles(dut.clk, remaining + 1)
 
 
 # ============================================================================
 # COCOTB TEST 1: VALID KEY IN TIME WINDOW (Cycles 3-5)
 # ============================================================================
 @cocotb.test()
-async def test_replay_valid_timing_cycle3(dut):
-    """Test that the key is accepted when entered at cycle 3"""
-    dut._log.info("REPLAY TEST 1: VALID KEY AT CYCLE 3")
-    clock = Clock(dut.clk, CLOCK_PERIOD_NS, unit="ns")
-    cocotb.start_soon(clock.start())
+@cocotb.parametrize(cycle=(3, 4, 5))
+async def test_replay_valid_timing(dut, cycle):
+    """Test that the key is accepted when entered at cycle 3, 4 or 5"""
+    dut._log.info(f"REPLAY TESTS 1-3: VALID KEY AT CYCLE {cycle}")
+    start_clock(dut)
     await reset_sentinel(dut)
     
     # Start with no key
@@ -54,195 +89,76 @@ async def test_replay_valid_timing_cycle3(dut):
     dut.ena.value = 1
     await ClockCycles(dut.clk, 1)  # Cycle 0: ena rising edge detected
     
-    # Wait until cycle 3 (we're at cycle 1 after ena, so wait 2 more)
-    await ClockCycles(dut.clk, 2)  # Now at cycle 3
-    
-    # Present the key at cycle 3
-    dut.ui_in.value = VAELIX_KEY
-    await ClockCycles(dut.clk, 1)
-    
-    # Check authorization
-    assert int(dut.uo_out.value) == SEG_VERIFIED, \
-        f"Key at cycle 3 rejected! Expected {hex(SEG_VERIFIED)}, got {hex(int(dut.uo_out.value))}"
-    assert int(dut.uio_out.value) == GLOW_ACTIVE
-    dut._log.info("  [PASS] Key accepted at cycle 3")
-
-
-@cocotb.test()
-async def test_replay_valid_timing_cycle4(dut):
-    """Test that the key is accepted when entered at cycle 4"""
-    dut._log.info("REPLAY TEST 2: VALID KEY AT CYCLE 4")
-    clock = Clock(dut.clk, CLOCK_PERIOD_NS, unit="ns")
-    cocotb.start_soon(clock.start())
-    await reset_sentinel(dut)
-    
-    # Start with no key
-    dut.ui_in.value = 0x00
-    
-    # Raise ena
-    dut.ena.value = 1
-    await ClockCycles(dut.clk, 1)  # Cycle 0
-    
-    # Wait until cycle 4
-    await ClockCycles(dut.clk, 3)  # Now at cycle 4
-    
-    # Present the key
-    dut.ui_in.value = VAELIX_KEY
-    await ClockCycles(dut.clk, 1)
-    
-    # Check authorization
-    assert int(dut.uo_out.value) == SEG_VERIFIED, \
-        f"Key at cycle 4 rejected!"
-    assert int(dut.uio_out.value) == GLOW_ACTIVE
-    dut._log.info("  [PASS] Key accepted at cycle 4")
-
-
-@cocotb.test()
-async def test_replay_valid_timing_cycle5(dut):
-    """Test that the key is accepted when entered at cycle 5"""
-    dut._log.info("REPLAY TEST 3: VALID KEY AT CYCLE 5")
-    clock = Clock(dut.clk, CLOCK_PERIOD_NS, unit="ns")
-    cocotb.start_soon(clock.start())
-    await reset_sentinel(dut)
-    
-    # Start with no key
-    dut.ui_in.value = 0x00
-    
-    # Raise ena
-    dut.ena.value = 1
-    await ClockCycles(dut.clk, 1)  # Cycle 0
-    
-    # Wait until cycle 5
-    await ClockCycles(dut.clk, 4)  # Now at cycle 5
+    # Wait until the target cycle (we're at cycle 1 after ena)
+    await wait_cycles(dut.clk, cycle - 1)
     
-    # Present the key
+    # Present the key at the target cycle
     dut.ui_in.value = VAELIX_KEY
     await ClockCycles(dut.clk, 1)
     
     # Check authorization
-    assert int(dut.uo_out.value) == SEG_VERIFIED, \
-        f"Key at cycle 5 rejected!"
+    seg = int(dut.uo_out.value)
+    assert seg == SEG_VERIFIED, \
+        f"Key at cycle {cycle} rejected! Expected {hex(SEG_VERIFIED)}, got {hex(seg)}"
     assert int(dut.uio_out.value) == GLOW_ACTIVE
-    dut._log.info("  [PASS] Key accepted at cycle 5")
-
-
-# ============================================================================
-# COCOTB TEST 4: REPLAY ATTACK - IMMEDIATE (Cycle 0)
-# ============================================================================
-@cocotb.test()
-async def test_replay_attack_immediate(dut):
-    """Test that key present at cycle 0 triggers REPLAY_LOCKOUT"""
-    dut._log.info("REPLAY TEST 4: IMMEDIATE REPLAY ATTACK (Cycle 0)")
-    clock = Clock(dut.clk, CLOCK_PERIOD_NS, unit="ns")
-    cocotb.start_soon(clock.start())
-    await reset_sentinel(dut)
-    
-    # Present key BEFORE raising ena (static signal / jammed pin)
-    dut.ui_in.value = VAELIX_KEY
-    
-    # Raise ena with key already present
-    dut.ena.value = 1
-    await ClockCycles(dut.clk, 1)  # Cycle 0: ena rises, key already there
-    
-    # System should detect replay and enter REPLAY_LOCKOUT
-    # Check that we're locked (not authorized)
-    assert int(dut.uo_out.value) == SEG_LOCKED, \
-        f"BREACH! Key accepted at cycle 0 (should be locked)"
-    assert int(dut.uio_out.value) == GLOW_DORMANT
-    dut._log.info("  [PASS] Immediate replay detected, system locked")
-    
-    # Try to present key again in valid window - should still be locked
-    await ClockCycles(dut.clk, 3)  # Now at cycle 4
-    dut.ui_in.value = 0x00
-    await ClockCycles(dut.clk, 1)
-    dut.ui_in.value = VAELIX_KEY
-    await ClockCycles(dut.clk, 1)
-    
-    # Should still be locked
-    assert int(dut.uo_out.value) == SEG_LOCKED, \
-        f"BREACH! System unlocked during lockout"
-    dut._log.info("  [PASS] System remains locked during replay lockout")
+    dut._log.info(f"  [PASS] Key accepted at cycle {cycle}")
 
 
 # ============================================================================
-# COCOTB TEST 5: REPLAY ATTACK - TOO EARLY (Cycle 1-2)
+# COCOTB TESTS 4-8: KEY OUTSIDE THE TIME WINDOW (Cycles 0-2, 6, 10)
 # ============================================================================
+# Cycle 0: key already on the bus when ena rises (static signal / jammed pin)
+# Cycles 1-2: too early; cycle 6: just past the window; cycle 10: late replay
 @cocotb.test()
-async def test_replay_attack_too_early(dut):
-    """Test that key at cycle 1 or 2 is rejected (too early)"""
-    dut._log.info("REPLAY TEST 5: KEY TOO EARLY (Cycle 1-2)")
-    clock = Clock(dut.clk, CLOCK_PERIOD_NS, unit="ns")
-    cocotb.start_soon(clock.start())
+@cocotb.parametrize(cycle=(0, 1, 2, 6, 10))
+async def test_replay_rejected_timing(dut, cycle):
+    """Test that the key is rejected outside cycles 3-5"""
+    dut._log.info(f"REPLAY TESTS 4-8: KEY REJECTED AT CYCLE {cycle}")
+    start_clock(dut)
     await reset_sentinel(dut)
     
-    # Start with no key
-    dut.ui_in.value = 0x00
-    
-    # Raise ena
-    dut.ena.value = 1
-    await ClockCycles(dut.clk, 1)  # Cycle 0
-    
-    # Present key at cycle 1 (too early)
-    await ClockCycles(dut.clk, 1)  # Now at cycle 1
-    dut.ui_in.value = VAELIX_KEY
-    await ClockCycles(dut.clk, 1)
+    # At cycle 0 the key is on the bus before ena rises (static signal /
+    # jammed pin); otherwise start with no key
+    dut.ui_in.value = VAELIX_KEY if cycle == 0 else 0x00
     
-    # Should be locked (key too early)
-    assert int(dut.uo_out.value) == SEG_LOCKED, \
-        f"BREACH! Key accepted at cycle 1 (too early)"
-    dut._log.info("  [PASS] Key at cycle 1 rejected")
-
-
-# ============================================================================
-# COCOTB TEST 6: REPLAY ATTACK - TOO LATE (Cycle 10+)
-# ============================================================================
-@cocotb.test()
-async def test_replay_attack_too_late(dut):
-    """Test that key at cycle 10 or later triggers REPLAY_LOCKOUT"""
-    dut._log.info("REPLAY TEST 6: LATE REPLAY ATTACK (Cycle 10+)")
-    clock = Clock(dut.clk, CLOCK_PERIOD_NS, unit="ns")
-    cocotb.start_soon(clock.start())
-    await reset_sentinel(dut)
-    
-    # Start with no key
-    dut.ui_in.value = 0x00
-    
-    # Raise ena
+    # Raise ena to start timing
     dut.ena.value = 1
-    await ClockCycles(dut.clk, 1)  # Cycle 0
-    
-    # Wait until cycle 10
-    await ClockCycles(dut.clk, 10)  # Now at cycle 10
-    
-    # Present key at cycle 10 (too late, replay attack)
-    dut.ui_in.value = VAELIX_KEY
-    await ClockCycles(dut.clk, 1)
+    await ClockCycles(dut.clk, 1)  # Cycle 0: ena rising edge detected
     
-    # System should detect replay and enter REPLAY_LOCKOUT
-    assert int(dut.uo_out.value) == SEG_LOCKED, \
-        f"BREACH! Key accepted at cycle 10 (should trigger lockout)"
+    if cycle > 0:
+        # Wait until the target cycle (we're at cycle 1 after ena)
+        if cycle > 1:
+            await wait_cycles(dut.clk, cycle - 1)
+        
+        # Present the key at the target cycle
+        dut.ui_in.value = VAELIX_KEY
+        await ClockCycles(dut.clk, 1)
+    
+    # Check rejection
+    seg = int(dut.uo_out.value)
+    assert seg == SEG_LOCKED, \
+        f"BREACH! Key accepted at cycle {cycle}: expected {hex(SEG_LOCKED)}, got {hex(seg)}"
     assert int(dut.uio_out.value) == GLOW_DORMANT
-    dut._log.info("  [PASS] Late replay detected, system locked")
+    dut._log.info(f"  [PASS] Key rejected at cycle {cycle}")
 
 
 # ============================================================================
-# COCOTB TEST 7: REPLAY ATTACK - HELD CONSTANT
+# COCOTB TEST 9: REPLAY ATTACK - HELD CONSTANT
 # ============================================================================
 @cocotb.test()
 async def test_replay_attack_constant_key(dut):
     """Test that a constant key held on the bus is detected as replay attack"""
-    dut._log.info("REPLAY TEST 7: CONSTANT KEY REPLAY (Static Signal)")
-    clock = Clock(dut.clk, CLOCK_PERIOD_NS, unit="ns")
-    cocotb.start_soon(clock.start())
+    dut._log.info("REPLAY TEST 9: CONSTANT KEY REPLAY (Static Signal)")
+    start_clock(dut)
     await reset_sentinel(dut)
     
     # Hold key constant from the start
     dut.ui_in.value = VAELIX_KEY
-    await ClockCycles(dut.clk, 5)
+    await wait_cycles(dut.clk, 5)
     
     # Raise ena with key already held constant
     dut.ena.value = 1
-    await ClockCycles(dut.clk, 10)
+    await wait_cycles(dut.clk, 10)
     
     # System should be locked (key was present at cycle 0)
     assert int(dut.uo_out.value) == SEG_LOCKED, \
@@ -252,14 +168,13 @@ async def test_replay_attack_constant_key(dut):
 
 
 # ============================================================================
-# COCOTB TEST 8: LOCKOUT DURATION (Simplified Test)
+# COCOTB TEST 10: LOCKOUT DURATION (Simplified Test)
 # ============================================================================
 @cocotb.test()
 async def test_replay_lockout_duration(dut):
     """Test that lockout lasts for the specified duration (simplified)"""
-    dut._log.info("REPLAY TEST 8: LOCKOUT DURATION (Simplified)")
-    clock = Clock(dut.clk, CLOCK_PERIOD_NS, unit="ns")
-    cocotb.start_soon(clock.start())
+    dut._log.info("REPLAY TEST 10: LOCKOUT DURATION (Simplified)")
+    start_clock(dut)
     await reset_sentinel(dut)
     
     # Trigger replay lockout (key at cycle 0)
@@ -271,28 +186,44 @@ async def test_replay_lockout_duration(dut):
     assert int(dut.uo_out.value) == SEG_LOCKED
     dut._log.info("  [INFO] Lockout triggered")
     
+    # Try to present key again in valid window - should still be locked
+    await ClockCycles(dut.clk, 3)  # Now at cycle 4
+    dut.ui_in.value = 0x00
+    await ClockCycles(dut.clk, 1)
+    dut.ui_in.value = VAELIX_KEY
+    await ClockCycles(dut.clk, 1)
+    assert int(dut.uo_out.value) == SEG_LOCKED, \
+        f"BREACH! System unlocked during lockout"
+    dut._log.info("  [PASS] System remains locked during replay lockout")
+    
     # Remove the key
     dut.ui_in.value = 0x00
     
     # Wait a bit (not full 10 seconds for simulation time)
     # Test that we stay locked for a reasonable number of cycles
-    await ClockCycles(dut.clk, 1000)
+    await wait_cycles(dut.clk, 1000)
     assert int(dut.uo_out.value) == SEG_LOCKED
+    assert int(dut.user_project.lockout_timer.value) > 0, \
+        "Lockout timer ran out after 1000 cycles"
     dut._log.info("  [PASS] System remains locked during lockout period")
     
-    # Note: Full 10-second test would take too long in simulation
-    # The important thing is that we enter lockout and stay there
+    # Skip the rest of the 10 s lockout via the timer backdoor
+    await fast_forward_lockout(dut)
+    assert int(dut.user_project.lockout_timer.value) == 0, \
+        "Lockout timer did not run out"
+    assert int(dut.uo_out.value) == SEG_LOCKED, \
+        "BREACH! Lockout expired into an authorized state"
+    dut._log.info("  [PASS] Lockout expired with the system locked")
 
 
 # ============================================================================
-# COCOTB TEST 9: RECOVERY AFTER LOCKOUT
+# COCOTB TEST 11: RECOVERY AFTER LOCKOUT
 # ============================================================================
 @cocotb.test()
 async def test_replay_recovery_after_reset(dut):
     """Test that system recovers after reset"""
-    dut._log.info("REPLAY TEST 9: RECOVERY AFTER RESET")
-    clock = Clock(dut.clk, CLOCK_PERIOD_NS, unit="ns")
-    cocotb.start_soon(clock.start())
+    dut._log.info("REPLAY TEST 11: RECOVERY AFTER RESET")
+    start_clock(dut)
     await reset_sentinel(dut)
     
     # Trigger replay lockout
@@ -319,34 +250,3 @@ async def test_replay_recovery_after_reset(dut):
     assert int(dut.uo_out.value) == SEG_VERIFIED, \
         f"System didn't recover after reset"
     dut._log.info("  [PASS] System recovered after reset, valid key accepted")
-
-
-# ============================================================================
-# COCOTB TEST 10: BOUNDARY TEST - CYCLE 6 (Just Outside Window)
-# ============================================================================
-@cocotb.test()
-async def test_replay_boundary_cycle6(dut):
-    """Test that key at cycle 6 is rejected (just outside valid window)"""
-    dut._log.info("REPLAY TEST 10: BOUNDARY TEST - CYCLE 6")
-    clock = Clock(dut.clk, CLOCK_PERIOD_NS, unit="ns")
-    cocotb.start_soon(clock.start())
-    await reset_sentinel(dut)
-    
-    # Start with no key
-    dut.ui_in.value = 0x00
-    
-    # Raise ena
-    dut.ena.value = 1
-    await ClockCycles(dut.clk, 1)  # Cycle 0
-    
-    # Wait until cycle 6 (just after valid window)
-    await ClockCycles(dut.clk, 5)  # Now at cycle 6
-    
-    # Present key at cycle 6
-    dut.ui_in.value = VAELIX_KEY
-    await ClockCycles(dut.clk, 1)
-    
-    # Should be locked (outside window, but not yet triggering lockout)
-    assert int(dut.uo_out.value) == SEG_LOCKED, \
-        f"BREACH! Key accepted at cycle 6 (outside valid window)"
-    dut._log.info("  [PASS] Key at cycle 6 rejected (outside window)")
@@ -6,10 +6,9 @@ Demonstrates that the bitslicing comparator provides constant-time
 authentication, eliminating Hamming Weight leakage.
 """
 
-print("=" * 80)
-print("KAMKAR EQUALIZER: Power Analysis Defense Verification")
-print("=" * 80)
-print()
+import contextlib
+import io
+import sys
 
 VAELIX_KEY = 0xB6
 
@@ -27,85 +26,103 @@ def bitslicing_compare(ui_in, key):
     
     # Step 2: OR-reduce to single bit (any difference?)
     # In hardware: diff[7] | diff[6] | diff[5] | ... | diff[0]
-    any_diff = 0
-    for i in range(8):
-        any_diff |= (diff >> i) & 1
+    # The 8-bit OR-reduction is exactly "diff is non-zero"; the gates run
+    # in silicon, so the model need not loop over them.
+    any_diff = int(diff != 0)
     
     # Step 3: NOT to get authorization result
     is_authorized = 1 - any_diff
     
     return is_authorized, diff, any_diff
 
-print("VERIFICATION 1: Functional Correctness")
-print("-" * 80)
 
-# Test correct key
-is_auth, diff, any_diff = bitslicing_compare(VAELIX_KEY, VAELIX_KEY)
-print(f"Input: 0x{VAELIX_KEY:02X} (correct key)")
-print(f"  diff = 0x{diff:02X} (should be 0x00)")
-print(f"  any_diff = {any_diff} (should be 0)")
-print(f"  is_authorized = {is_auth} (should be 1)")
-assert diff == 0x00, "diff should be 0x00 for correct key"
-assert any_diff == 0, "any_diff should be 0 for correct key"
-assert is_auth == 1, "is_authorized should be 1 for correct key"
-print("  ✓ PASS: Correct key accepted")
-print()
+def main():
+    print("=" * 80)
+    print("KAMKAR EQUALIZER: Power Analysis Defense Verification")
+    print("=" * 80)
+    print()
+
+    print("VERIFICATION 1: Functional Correctness")
+    print("-" * 80)
 
-# Test incorrect keys
-test_inputs = [0x00, 0xFF, 0x01, 0xFE, 0xB7, 0x49, 0xAA, 0x55]
-for test_val in test_inputs:
-    is_auth, diff, any_diff = bitslicing_compare(test_val, VAELIX_KEY)
-    print(f"Input: 0x{test_val:02X}")
-    print(f"  diff = 0x{diff:02X}, any_diff = {any_diff}, is_authorized = {is_auth}")
-    assert is_auth == 0, f"Key 0x{test_val:02X} should be rejected"
-    print(f"  ✓ PASS: Incorrect key rejected")
-print()
+    # Test correct key
+    is_auth, diff, any_diff = bitslicing_compare(VAELIX_KEY, VAELIX_KEY)
+    print(f"Input: 0x{VAELIX_KEY:02X} (correct key)")
+    print(f"  diff = 0x{diff:02X} (should be 0x00)")
+    print(f"  any_diff = {any_diff} (should be 0)")
+    print(f"  is_authorized = {is_auth} (should be 1)")
+    assert diff == 0x00, "diff should be 0x00 for correct key"
+    assert any_diff == 0, "any_diff should be 0 for correct key"
+    assert is_auth == 1, "is_authorized should be 1 for correct key"
+    print("  ✓ PASS: Correct key accepted")
+    print()
 
-print("VERIFICATION 2: Constant-Time Property")
-print("-" * 80)
-print()
-print("Key insight: All inputs execute EXACTLY the same operations:")
-print("  1. Eight (8) XOR operations: ui_in[7:0] ^ key[7:0]")
-print("  2. Seven (7) OR operations: diff[7] | diff[6] | ... | diff[0]")
-print("  3. One (1) NOT operation: ~any_diff")
-print()
-print("Total: 16 gate-level operations, regardless of input value")
-print()
+    # Test incorrect keys: the whole 8-bit input space, so exactly one
+    # value may authorize
+    accepted = [v for v in range(256) if bitslicing_compare(v, VAELIX_KEY)[0]]
+    print("Inputs: 0x00-0xFF (all 256)")
+    print(f"  accepted = {[f'0x{v:02X}' for v in accepted]} (should be ['0x{VAELIX_KEY:02X}'])")
+    assert accepted == [VAELIX_KEY], \
+        f"Only 0x{VAELIX_KEY:02X} should be accepted, got {[hex(v) for v in accepted]}"
+    print("  ✓ PASS: All 255 incorrect keys rejected")
+    print()
 
-# Demonstrate with extreme opposites
-inputs_to_test = [
-    (0x00, "All zeros"),
-    (0xFF, "All ones"),
-    (0xB6, "Correct key"),
-    (0x49, "Inverted key"),
-]
+    print("VERIFICATION 2: Constant-Time Property")
+    print("-" * 80)
+    print()
+    print("Key insight: All inputs execute EXACTLY the same operations:")
+    print("  1. Eight (8) XOR operations: ui_in[7:0] ^ key[7:0]")
+    print("  2. Seven (7) OR operations: diff[7] | diff[6] | ... | diff[0]")
+    print("  3. One (1) NOT operation: ~any_diff")
+    print()
+    print("Total: 16 gate-level operations, regardless of input value")
+    print()
 
-print("Comparison of different inputs:")
-print()
-for test_val, description in inputs_to_test:
-    is_auth, diff, any_diff = bitslicing_compare(test_val, VAELIX_KEY)
-    ones_in_diff = bin(diff).count('1')
+    # Demonstrate with extreme opposites
+    inputs_to_test = [
+        (0x00, "All zeros"),
+        (0xFF, "All ones"),
+        (0xB6, "Correct key"),
+        (0x49, "Inverted key"),
+    ]
+
+    print("Comparison of different inputs:")
+    print()
+    for test_val, description in inputs_to_test:
+        is_auth, diff, any_diff = bitslicing_compare(test_val, VAELIX_KEY)
+        ones_in_diff = diff.bit_count()
     
-    print(f"{description:15s} (0x{test_val:02X}):")
-    print(f"  Operations: 8 XOR + 7 OR + 1 NOT = 16 operations (constant)")
-    print(f"  diff = 0x{diff:02X} ({ones_in_diff} ones) → any_diff = {any_diff} → auth = {is_auth}")
+        print(f"{description:15s} (0x{test_val:02X}):")
+        print(f"  Operations: 8 XOR + 7 OR + 1 NOT = 16 operations (constant)")
+        print(f"  diff = 0x{diff:02X} ({ones_in_diff} ones) → any_diff = {any_diff} → auth = {is_auth}")
+        print()
+
+    print("VERIFICATION 3: Power Analysis Defense")
+    print("-" * 80)
     print()
+    print("Traditional comparison (ui_in == key):")
+    print("  - Variable gate transitions based on how many bits match")
+    print("  - Power consumption leaks information about correct bits")
+    print("  - Samy Kamkar's power analysis extracts the key")
+    print()
+    print("Bitslicing comparator (ui_in ^ key → OR-reduce → NOT):")
+    print("  - Fixed gate transitions (always 8 XOR + 7 OR + 1 NOT)")
+    print("  - Power consumption independent of input value")
+    print("  - Power analysis learns nothing about the key")
+    print()
+
+    print("=" * 80)
+    print("KAMKAR EQUALIZER: ✓ OPERATIONAL")
+    print("Power Analysis Defense: ✓ ACTIVE")
+    print("=" * 80)
 
-print("VERIFICATION 3: Power Analysis Defense")
-print("-" * 80)
-print()
-print("Traditional comparison (ui_in == key):")
-print("  - Variable gate transitions based on how many bits match")
-print("  - Power consumption leaks information about correct bits")
-print("  - Samy Kamkar's power analysis extracts the key")
-print()
-print("Bitslicing comparator (ui_in ^ key → OR-reduce → NOT):")
-print("  - Fixed gate transitions (always 8 XOR + 7 OR + 1 NOT)")
-print("  - Power consumption independent of input value")
-print("  - Power analysis learns nothing about the key")
-print()
 
-print("=" * 80)
-print("KAMKAR EQUALIZER: ✓ OPERATIONAL")
-print("Power Analysis Defense: ✓ ACTIVE")
-print("=" * 80)
+if __name__ == "__main__":
+    # Build the whole report in memory and write it once; the finally
+    # still emits everything up to a failed assertion.
+    report = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(report):
+            main()
+    finally:
+        sys.stdout.write(report.getvalue())